@@ -4,9 +4,11 @@ from collections import Counter
 
 import networkx
 
-w_directory = json.load(open("joshi_dir.json"))
+with open("joshi_dir.json") as fp:
+    w_directory = json.load(fp)
 
-g = networkx.node_link_graph(json.load(open("joshi_net.json")))
+with open("joshi_net.json") as fp:
+    g = networkx.node_link_graph(json.load(fp))
 print(g)
 c = networkx.community.louvain_communities(g)
 for x in c:
@@ -5,7 +5,6 @@ from collections import Counter
 from tabulate import tabulate
 
 from joshi_data import joshi_promotions, known_joshi, non_joshi, promotion_map
-from scrape import get_all_wrestlers
 
 
 def create_directory():
@@ -14,29 +13,35 @@ def create_directory():
     directory = {}
 
     for wrestler_json in data:
-        info = json.load(wrestler_json.open())
+        with wrestler_json.open() as fp:
+            info = json.load(fp)
         w_id = wrestler_json.stem
         proms = Counter(match["promotion"][1] for match in info if match["promotion"])
-        names = Counter()
-        opps = set()
-        for match in info:
-            for wrestler_id, wrestler_name in match["wrestlers"]:
-                if wrestler_id == w_id:
-                    names[wrestler_name.strip()] += 1
-                else:
-                    opps.add(wrestler_id)
+        names = Counter(
+            wrestler_name.strip()
+            for match in info
+            for wrestler_id, wrestler_name in match["wrestlers"]
+            if wrestler_id == w_id
+        )
+        opps = {
+            wrestler_id
+            for match in info
+            for wrestler_id, _ in match["wrestlers"]
+            if wrestler_id != w_id
+        }
         # print(w_id, proms.most_common(1), names.most_common(1))
+        top_proms = [x[0] for x in proms.most_common(3)]
         joshi = False
         if w_id in known_joshi:
             joshi = True
         elif w_id in non_joshi:
             joshi = False
-        elif joshi_promotions & set(x[0] for x in proms.most_common(3)):
+        elif joshi_promotions.intersection(top_proms):
             joshi = True
 
         d = {
             "name": names.most_common(1)[0][0],
-            "promotion": promotion_map.get(w_id, proms.most_common(1)[0][0]),
+            "promotion": promotion_map.get(w_id, top_proms[0]),
             "joshi": joshi,
             "matches": len(info),
             "opponents": list(opps),
@@ -47,7 +52,8 @@ def create_directory():
 
 
 def summarize_directory():
-    d = json.load(open("joshi_dir.json"))
+    with open("joshi_dir.json") as fp:
+        d = json.load(fp)
     proms = Counter(
         wrestler["promotion"] for wrestler in d.values() if wrestler["joshi"]
     )
@@ -80,5 +86,5 @@ def find_outliers(d):
 
 
 if __name__ == "__main__":
-    json.dump(create_directory(), open("joshi_dir.json", "w"), indent=2)
+    pathlib.Path("joshi_dir.json").write_text(json.dumps(create_directory(), indent=2))
     summarize_directory()
@@ -4,18 +4,16 @@ import pathlib
 from collections import Counter
 
 from identifier import Identifier
-from joshi_data import joshi_promotions, non_joshi
+from joshi_data import non_joshi
 
-w_directory = json.load(open("joshi_dir.json"))
+with open("joshi_dir.json") as fp:
+    w_directory = json.load(fp)
 
 
 def joshi_wrestlers():
     return {x for x, y in w_directory.items() if y["joshi"] and x not in non_joshi}
 
 
-j_p = list(joshi_promotions)
-
-
 def build_graph():
     data = pathlib.Path("data").glob("[0-9]*.json")
 
@@ -24,37 +22,41 @@ def build_graph():
     interactions = Counter()
     match_counts = Counter()
     for df in data:
-        info = json.load(df.open())
+        with df.open() as fp:
+            info = json.load(fp)
         w_id = int(df.stem)
+        match_counts[w_id] += len(info)
         for match in info:
-            match_counts[w_id] += 1
-            for wrestler in match["wrestlers"]:
-                pairing = [w_id, int(wrestler[0])]
-                pairing.sort()
-                interactions[tuple(pairing)] += 1
-
-                wrestlers.add(wrestler[0])
+            opponents = [int(wrestler[0]) for wrestler in match["wrestlers"]]
+            interactions.update(
+                (w_id, opponent) if w_id < opponent else (opponent, w_id)
+                for opponent in opponents
+            )
+            wrestlers.update(opponents)
         # wget_all_wrestlers(info))
     d = {}
     nodes = []
-    to_remove = {x for x in wrestlers if match_counts[int(x)] < 2}
-    wrestlers = wrestlers.difference(to_remove)
-    wrestlers = wrestlers.intersection(joshi_wrestlers())
+    wrestlers = {
+        x
+        for x in (int(w) for w in joshi_wrestlers())
+        if x in wrestlers and match_counts[x] >= 2
+    }
     for wrestler in wrestlers:
+        w_id = str(wrestler)
+        entry = w_directory[w_id]
         nodes.append(
             {
-                "id": str(wrestler),
-                "group": promotion_id[w_directory[str(wrestler)]["promotion"]],
-                "promotion": w_directory[str(wrestler)]["promotion"],
-                "name": w_directory[str(wrestler)]["name"],
+                "id": w_id,
+                "group": promotion_id[entry["promotion"]],
+                "promotion": entry["promotion"],
+                "name": entry["name"],
             }
         )
     d["nodes"] = nodes
 
     links = []
-    for interaction, count in interactions.items():
-        source, target = tuple(interaction)
-        if str(source) in wrestlers and str(target) in wrestlers and count > 1:
+    for (source, target), count in interactions.items():
+        if count > 1 and source in wrestlers and target in wrestlers:
             links.append(
                 {
                     "source": str(source),
@@ -73,4 +75,4 @@ if __name__ == "__main__":
     print(
         f"Writing {len(output['nodes'])} wrestlers with {len(output['links'])} links to '{fn}'"
     )
-    json.dump(output, open(fn, "w"))
+    pathlib.Path(fn).write_text(json.dumps(output))
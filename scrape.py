@@ -1,3 +1,4 @@
+import functools
 import json
 import pathlib
 import re
@@ -5,7 +6,7 @@ import time
 import urllib
 
 import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 date_re = re.compile(r"([0-9]+)\.([0-9]+)\.([0-9]+)")
 
@@ -13,32 +14,34 @@ id_href = re.compile("nr=([0-9]+)")
 tag_href = re.compile("[?]id=(28|29)")
 event_href = re.compile("[?]id=1")
 
+match_rows = SoupStrainer("tr")
+
 
 wrestler_url = """https://www.cagematch.net/?id=2&nr={wrestler_id}&page=4&year={year}&region=Asien"""
 
+# shared so keep-alive connections to cagematch are reused across wrestlers
+session = requests.Session()
+
 
 def get_matches(wrestler_id: int, year: int, start=0) -> list[dict]:
     """Get all the matches for that wrestler_id for the given year."""
-    with requests.Session() as s:
-        # print(wrestler_url.format(wrestler_id=wrestler_id, year=year))
-        if start:
-            url = wrestler_url + f"&s={start}"
-        else:
-            url = wrestler_url
-        r = s.get(
-            url.format(wrestler_id=wrestler_id, year=year),
-            headers={"accept-encoding": "compress"},
-        )
-        if r:
-            matches = list(parse_matches(r.text))
-            if len(matches) == 100:
-                return matches + get_matches(wrestler_id, year, start + 100)
-            else:
-                return matches
+    base_url = wrestler_url.format(wrestler_id=wrestler_id, year=year)
+    matches = []
+    while True:
+        url = base_url + f"&s={start}" if start else base_url
+        # print(url)
+        r = session.get(url, headers={"accept-encoding": "compress"})
+        if not r:
+            return None
+        page = list(parse_matches(r.text))
+        matches.extend(page)
+        if len(page) != 100:
+            return matches
+        start += 100
 
 
 def parse_matches(content: str) -> list[dict]:
-    soup = BeautifulSoup(content, "html.parser")
+    soup = BeautifulSoup(content, "html.parser", parse_only=match_rows)
     # print(soup)
     for match in soup.find_all("tr", ["TRow1", "TRow2"]):
         # print(match)
@@ -102,14 +105,19 @@ def reload_wrestler(wrestler_id, year):
     json_file = pathlib.Path(f"data/{wrestler_id}.json")
     week = 60 * 60 * 24 * 7
 
-    if json_file.exists() and (time.time() - json_file.stat().st_mtime) < week:
+    try:
+        fresh = (time.time() - json_file.stat().st_mtime) < week
+    except FileNotFoundError:
+        fresh = False
+
+    if fresh:
         # print("skipping..")
-        m = json.load(json_file.open("r"))
+        with json_file.open("r") as fp:
+            m = json.load(fp)
     else:
         m = get_matches(wrestler_id, year)
         if m:
-            with json_file.open("w") as fp:
-                json.dump(m, fp, indent=2)
+            json_file.write_text(json.dumps(m, indent=2))
     return m
 
 
@@ -120,21 +128,24 @@ def get_all_wrestlers(matches):
     return w
 
 
+@functools.lru_cache(maxsize=None)
+def get_colleagues(wrestler_id: str, year: int) -> frozenset:
+    """Ids of everyone in wrestler_id's matches for year, memoized for the run."""
+    return frozenset(get_all_wrestlers(reload_wrestler(wrestler_id, year)))
+
+
 def follow_wrestlers(wrestler_id, year):
-    matches = reload_wrestler(wrestler_id, year)
-    first_degree = get_all_wrestlers(matches)
+    first_degree = get_colleagues(str(wrestler_id), year)
     second_degree = set()
     print(len(first_degree), "first degree.")
     for wrestler_id in first_degree:
-        matches = reload_wrestler(wrestler_id, year)
-        second_degree.update(get_all_wrestlers(matches))
+        second_degree.update(get_colleagues(wrestler_id, year))
     second_degree = second_degree.difference(first_degree)
     print(len(second_degree), "second degree.")
 
     third_degree = set()
     for wrestler_id in second_degree:
-        matches = reload_wrestler(wrestler_id, year)
-        third_degree.update(get_all_wrestlers(matches))
+        third_degree.update(get_colleagues(wrestler_id, year))
     third_degree = third_degree.difference(first_degree).difference(second_degree)
     print(len(third_degree), "third degree.")
 